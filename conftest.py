@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def db_engine():
+    """One MySQL engine shared by every test in the session"""
+    if 'DB_PASS' not in os.environ:
+        pytest.skip("DB_PASS not set; skipping MySQL tests")
+
+    # Imported after the skip check so collection never needs the DB stack
+    from src.database_connection import DatabaseConnection
+
+    db = DatabaseConnection(
+        host=os.environ.get('DB_HOST', 'localhost'),
+        user=os.environ.get('DB_USER', 'root'),
+        password=os.environ['DB_PASS'],
+        database=os.environ.get('DB_NAME', 'customer_analytics'),
+        shared=False,
+    )
+    engine = db.create_connection()
+    if engine is None:
+        pytest.fail("❌ Connection failed. Check your credentials.")
+    yield engine
+    db.close_connection()
@@ -44,57 +44,15 @@ customer-shopping-analytics/
 
 from pathlib import Path
 import json
+import os
 import sys
 
 # Define project root
 PROJECT_NAME = "customer-shopping-analytics"
 ROOT = Path.cwd() / PROJECT_NAME
 
-# Directory and file structure
-structure = {
-    "data/raw": {
-        "customer_shopping_behavior.csv": None
-    },
-    "data/processed": {
-        "customer_cleaned.csv": None
-    },
-    "notebooks": {
-        "01_data_cleaning_and_eda.ipynb": "notebook",
-        "02_advanced_analytics.ipynb": "notebook",
-        "03_predictive_modeling.ipynb": "notebook",
-        "04_statistical_analysis.ipynb": "notebook",
-    },
-    "sql": {
-        "01_schema_creation.sql": "-- SQL: schema creation\n-- Add CREATE TABLE statements here\n",
-        "02_basic_queries.sql": "-- Basic queries for EDA and reporting\n",
-        "03_advanced_business_queries.sql": "-- Joins, window functions, cohort analysis queries\n",
-        "04_insights_queries.sql": "-- Business insights queries\n",
-    },
-    "powerbi/screenshots": {},
-    "powerbi/customer_behavior_dashboard.pbix": b"%PDF-1.4\n%placeholder pbix-like file\n",
-    "reports": {
-        "technical_report.md": "# Technical report\n\nDescribe methods, data pipeline, models, and results.\n",
-        "executive_summary.md": "# Executive summary\n\nHigh level summary for business stakeholders.\n",
-        "presentation.pdf": b"%PDF-1.4\n%placeholder PDF presentation\n",
-    },
-    "src": {
-        "__init__.py": "# src package\n",
-        "config.py": "# Configuration variables\nDB_PATH = 'data/processed/customer_cleaned.db'\n",
-        "database_connection.py": """# Simple sqlite database connection helper
-import sqlite3
-from pathlib import Path
-
-DB_FILE = Path(__file__).resolve().parents[1] / 'data' / 'processed' / 'customer_cleaned.db'
-
-def get_connection(db_path: str = None):
-    \"\"\"Return a sqlite3 connection. If db_path is None, a file in data/processed will be used.\"\"\"
-    path = DB_FILE if db_path is None else Path(db_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
-    return conn
-"""
-    },
-    ".gitignore": """# Python artifacts
+# Static payloads, encoded once at import time
+_GITIGNORE_BLOB = b"""# Python artifacts
 __pycache__/
 *.pyc
 *.pyo
@@ -111,10 +69,41 @@ data/raw/*
 data/processed/*
 # VSCode
 .vscode/
-""",
-    "requirements.txt": "pandas\nnumpy\nscikit-learn\nmatplotlib\nnotebook\n",
-    "README.md": f"# {PROJECT_NAME}\n\nProject skeleton for customer shopping analytics.\n\n## Structure\nSee folders for data, notebooks, SQL, reports and src.\n",
-}
+"""
+_REQ_BLOB = b"pandas\nnumpy\nscikit-learn\nmatplotlib\nnotebook\n"
+_README_BLOB = (
+    f"# {PROJECT_NAME}\n\nProject skeleton for customer shopping analytics.\n\n"
+    "## Structure\nSee folders for data, notebooks, SQL, reports and src.\n"
+).encode("utf-8")
+
+_DB_CONNECTION_BLOB = b"""# Simple sqlite database connection helper
+import sqlite3
+from pathlib import Path
+
+# Resolved once at import; get_connection never re-resolves it
+DB_FILE = Path(__file__).resolve().parents[1] / 'data' / 'processed' / 'customer_cleaned.db'
+
+# Parent directories already created by get_connection in this process
+_ENSURED_DIRS = set()
+
+def get_connection(db_path: str = None):
+    \"\"\"Return a sqlite3 connection. If db_path is None, a file in data/processed will be used.\"\"\"
+    path = DB_FILE if db_path is None else Path(db_path)
+    if path.parent not in _ENSURED_DIRS:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path.parent)
+    # Default isolation level: bulk inserts share one transaction and roll back on error
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    # WAL + synchronous=NORMAL avoids an fsync per commit; bigger cache and mmap for reads
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=268435456;"
+    )
+    return conn
+"""
 
 # Minimal Jupyter notebook template
 nb_skeleton = {
@@ -129,62 +118,105 @@ nb_skeleton = {
         }
     ]
 }
+_NB_BLOB = json.dumps(nb_skeleton, indent=2).encode("utf-8")
+
+# Directories created even though no file is written into them
+EMPTY_DIRS = ("powerbi/screenshots",)
+
+
+def iter_entries():
+    """Yield (relative path, payload) for every file in the skeleton.
+
+    A payload of None means "create empty file".
+    """
+    yield "data/raw/customer_shopping_behavior.csv", None
+    yield "data/processed/customer_cleaned.csv", None
+    yield "notebooks/01_data_cleaning_and_eda.ipynb", _NB_BLOB
+    yield "notebooks/02_advanced_analytics.ipynb", _NB_BLOB
+    yield "notebooks/03_predictive_modeling.ipynb", _NB_BLOB
+    yield "notebooks/04_statistical_analysis.ipynb", _NB_BLOB
+    yield "sql/01_schema_creation.sql", b"-- SQL: schema creation\n-- Add CREATE TABLE statements here\n"
+    yield "sql/02_basic_queries.sql", b"-- Basic queries for EDA and reporting\n"
+    yield "sql/03_advanced_business_queries.sql", b"-- Joins, window functions, cohort analysis queries\n"
+    yield "sql/04_insights_queries.sql", b"-- Business insights queries\n"
+    yield "powerbi/customer_behavior_dashboard.pbix", b"%PDF-1.4\n%placeholder pbix-like file\n"
+    yield "reports/technical_report.md", b"# Technical report\n\nDescribe methods, data pipeline, models, and results.\n"
+    yield "reports/executive_summary.md", b"# Executive summary\n\nHigh level summary for business stakeholders.\n"
+    yield "reports/presentation.pdf", b"%PDF-1.4\n%placeholder PDF presentation\n"
+    yield "src/__init__.py", b"# src package\n"
+    yield "src/config.py", b"# Configuration variables\nDB_PATH = 'data/processed/customer_cleaned.db'\n"
+    yield "src/database_connection.py", _DB_CONNECTION_BLOB
+    yield ".gitignore", _GITIGNORE_BLOB
+    yield "requirements.txt", _REQ_BLOB
+    yield "README.md", _README_BLOB
+
 
 # Sample CSV headers
-raw_csv_header = "customer_id,visit_date,product_id,category,quantity,price,total_spent\n"
-cleaned_csv_header = "customer_id,visit_date,product_id,category,quantity,price,total_spent,cleaned_flag\n"
+raw_csv_header = b"customer_id,visit_date,product_id,category,quantity,price,total_spent\n"
+cleaned_csv_header = b"customer_id,visit_date,product_id,category,quantity,price,total_spent,cleaned_flag\n"
+
+
+def create_file(path: Path, content, skip_mkdir=True):
+    """Utility to create file and write content.
 
+    Parent directories are expected to exist already (see flatten);
+    pass skip_mkdir=False to create them on the fly.
+    """
+    if not skip_mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    data = content if isinstance(content, (bytes, bytearray)) else str(content).encode("utf-8")
+    path.write_bytes(data)
 
-def create_file(path: Path, content, binary=False):
-    """Utility to create file and write content."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    mode = "wb" if binary else "w"
-    with open(path, mode) as f:
-        if binary:
-            if isinstance(content, bytes):
-                f.write(content)
-            else:
-                f.write(str(content).encode("utf-8"))
-        else:
-            f.write(content)
+
+def write_entry(entry):
+    """Write one (path, payload) entry produced by flatten."""
+    path, payload = entry
+    if payload is None:
+        path.touch()
+    else:
+        create_file(path, payload)
+
+
+def file_size(path: Path):
+    """Return the size of path with a single stat, or None if it is missing."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def flatten(root: Path):
+    """Resolve iter_entries against root and collect the dirs they need.
+
+    dirs includes every intermediate parent of the entries.
+    """
+    entries = [(root / rel_path, payload) for rel_path, payload in iter_entries()]
+    dirs = {root} | {root / rel_path for rel_path in EMPTY_DIRS}
+    for path, _ in entries:
+        dirs.add(path.parent)
+    # Add any intermediate parents (e.g. "data" for "data/raw")
+    for d in list(dirs):
+        dirs.update(p for p in d.parents if p.is_relative_to(root))
+    return entries, dirs
 
 
 def main():
     print(f"📁 Creating project skeleton at: {ROOT}")
-    for rel_path, value in structure.items():
-        target = ROOT / rel_path
-        if isinstance(value, dict):
-            target.mkdir(parents=True, exist_ok=True)
-            for fname, fcontent in value.items():
-                file_path = target / fname
-                if fcontent is None:
-                    file_path.touch()
-                elif fcontent == "notebook":
-                    file_path.write_text(json.dumps(nb_skeleton, indent=2))
-                elif isinstance(fcontent, bytes):
-                    create_file(file_path, fcontent, binary=True)
-                else:
-                    create_file(file_path, fcontent, binary=False)
-        else:
-            if isinstance(value, bytes):
-                create_file(target, value, binary=True)
-            else:
-                target.parent.mkdir(parents=True, exist_ok=True)
-                create_file(target, value, binary=False)
+    entries, dirs = flatten(ROOT)
+    for d in sorted(dirs, key=lambda p: len(p.parts)):
+        d.mkdir(exist_ok=True)
+
+    for entry in entries:
+        write_entry(entry)
 
     # Add CSV files with headers
     raw_csv = ROOT / "data" / "raw" / "customer_shopping_behavior.csv"
     processed_csv = ROOT / "data" / "processed" / "customer_cleaned.csv"
-    if not raw_csv.exists() or raw_csv.stat().st_size == 0:
+    if not file_size(raw_csv):
         create_file(raw_csv, raw_csv_header)
-    if not processed_csv.exists() or processed_csv.stat().st_size == 0:
+    if not file_size(processed_csv):
         create_file(processed_csv, cleaned_csv_header)
 
-    # Ensure src package init file exists
-    init_py = ROOT / "src" / "__init__.py"
-    if not init_py.exists():
-        create_file(init_py, "# src package\n")
-
     print("✅ Project skeleton created successfully!")
     print(f"➡ Open '{ROOT}' in VS Code to start working on your project.\n")
 
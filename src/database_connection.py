@@ -3,76 +3,236 @@ Database Connection Module
 Handles MySQL connection and data loading
 """
 
-import pandas as pd
-from sqlalchemy import create_engine
-import pymysql
-from urllib.parse import quote_plus
+import logging
+import os
+import tempfile
 import warnings
-warnings.filterwarnings('ignore')
+from pathlib import Path
+from urllib.parse import quote_plus
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.pool import NullPool
+
+log = logging.getLogger(__name__)
+
+# Prefer the C driver (mysqlclient); fall back to pure-Python PyMySQL
+try:
+    import MySQLdb  # noqa: F401
+    DRIVER = 'mysqldb'
+except ImportError:
+    import pymysql  # noqa: F401
+    DRIVER = 'pymysql'
+
+# Engines are shared per (host, user, password, database, port) so repeated
+# DatabaseConnection instances reuse one connection pool
+_ENGINE_CACHE = {}
+
+# Write buffer and rows per to_csv chunk for the LOAD DATA temp file
+_CSV_BUFFER_SIZE = 1 << 20
+_CSV_CHUNK_ROWS = 50_000
+
+
+def _backend_kwargs(dtype_backend):
+    """read_sql kwargs for the requested dtype backend (None = pandas default)"""
+    return {} if dtype_backend is None else {'dtype_backend': dtype_backend}
+
+
+def _prepare_for_infile(df):
+    """
+    Adapt a frame to how LOAD DATA parses the temp CSV
+
+    Backslashes in strings are doubled (LOAD DATA treats them as escapes, and
+    \\N marks NULL) and bools become 0/1 for the TINYINT columns to_sql creates.
+    Object columns holding only bools and NA count as bools, as in to_sql.
+    """
+    converted = {}
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            converted[col] = df[col].astype('Int8')
+        elif (pd.api.types.is_object_dtype(dtype)
+              and pd.api.types.infer_dtype(df[col], skipna=True) == 'boolean'):
+            converted[col] = df[col].map({True: 1, False: 0}).astype('Int8')
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            converted[col] = df[col].map(
+                lambda v: v.replace('\\', '\\\\') if isinstance(v, str) else v
+            )
+    if not converted:
+        return df
+    out = df.copy(deep=False)
+    for col, values in converted.items():
+        out[col] = values
+    return out
 
 
 class DatabaseConnection:
     def __init__(self, host='localhost', user='root', password='your_password',
-                 database='customer_analytics', port=3306):
+                 database='customer_analytics', port=3306, shared=True):
         """
         Initialize database connection
+
+        With shared=True (default) the engine is taken from a module-level
+        cache and is not disposed by close_connection.
         """
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.port = port
+        self.shared = shared
         self.engine = None
 
     def create_connection(self):
         """Create SQLAlchemy engine for MySQL"""
+        key = (self.host, self.user, self.password, self.database, self.port)
+        if self.shared and key in _ENGINE_CACHE:
+            self.engine = _ENGINE_CACHE[key]
+            return self.engine
+
         try:
-            # ✅ Properly encode the password so special characters like @, #, %, ! work
-            encoded_password = quote_plus(self.password)
-            connection_string = (
-                f"mysql+pymysql://{self.user}:{encoded_password}@{self.host}:{self.port}/{self.database}"
+            log.info("🔗 Connection string preview: mysql+%s://%s:<hidden>@%s:%s/%s",
+                     DRIVER, self.user, self.host, self.port, self.database)
+            self.engine = create_engine(
+                self._connection_string(),
+                pool_size=5,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=1800,
             )
-            print(f"\n🔗 Connection string preview: mysql+pymysql://{self.user}:<hidden>@{self.host}:{self.port}/{self.database}")
-            self.engine = create_engine(connection_string)
-            print(f"✅ Connected to MySQL database: {self.database}")
+            if self.shared:
+                _ENGINE_CACHE[key] = self.engine
+            log.info("✅ Connected to MySQL database: %s", self.database)
             return self.engine
         except Exception as e:
-            print(f"❌ Error connecting to database: {e}")
+            log.error("❌ Error connecting to database: %s", e)
             return None
 
-    def load_dataframe_to_db(self, df, table_name, if_exists='replace'):
-        """Load pandas DataFrame to MySQL table"""
+    def _connection_string(self):
+        """SQLAlchemy URL for this connection's settings"""
+        # ✅ Properly encode the password so special characters like @, #, %, ! work
+        encoded_password = quote_plus(self.password)
+        return (
+            f"mysql+{DRIVER}://{self.user}:{encoded_password}@{self.host}:{self.port}/{self.database}"
+            "?charset=utf8mb4"
+        )
+
+    def load_dataframe_to_db(self, df, table_name, if_exists='replace',
+                             chunksize=10_000, use_infile=False):
+        """
+        Load pandas DataFrame to MySQL table
+
+        Rows are sent as multi-row INSERTs of `chunksize` rows. With
+        use_infile=True the frame is bulk loaded through a temporary CSV and
+        LOAD DATA LOCAL INFILE (requires local_infile=ON on the server).
+        """
         if self.engine is None:
             self.create_connection()
 
         try:
-            df.to_sql(table_name, self.engine, if_exists=if_exists, index=False)
-            print(f"✅ Data loaded to table '{table_name}' successfully!")
-            print(f"   Rows loaded: {len(df):,}")
+            with warnings.catch_warnings():
+                # Table reflection in to_sql can warn about MySQL-specific types
+                warnings.filterwarnings('ignore', category=SAWarning,
+                                        message='.*reflect.*')
+                if use_infile:
+                    self._load_via_infile(df, table_name, if_exists)
+                else:
+                    # One connection/transaction for every chunk instead of one each
+                    with self.engine.begin() as conn:
+                        df.to_sql(table_name, conn, if_exists=if_exists, index=False,
+                                  method='multi', chunksize=chunksize)
+            log.info("✅ Data loaded to table '%s' successfully! Rows loaded: %d",
+                     table_name, len(df))
         except Exception as e:
-            print(f"❌ Error loading data: {e}")
+            log.error("❌ Error loading data: %s", e)
+
+    def _load_via_infile(self, df, table_name, if_exists):
+        """Create the table from the frame's schema, then LOAD DATA into it"""
+        # Let pandas create/replace the table with the right column types
+        df.head(0).to_sql(table_name, self.engine, if_exists=if_exists, index=False)
+
+        fd, tmp_path = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+        try:
+            # 1 MiB buffer: fewer write syscalls for large frames
+            with open(tmp_path, 'wb', buffering=_CSV_BUFFER_SIZE) as f:
+                _prepare_for_infile(df).to_csv(f, index=False, header=False,
+                                               na_rep='\\N', lineterminator='\n',
+                                               chunksize=_CSV_CHUNK_ROWS)
+            load_stmt = text(
+                f"LOAD DATA LOCAL INFILE :path INTO TABLE `{table_name}` "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                "LINES TERMINATED BY '\\n'"
+            )
+            # LOCAL INFILE lets the server read client files, so it is only
+            # enabled on this short-lived engine, never on the pooled one
+            infile_engine = create_engine(self._connection_string(),
+                                          poolclass=NullPool,
+                                          connect_args={"local_infile": True})
+            try:
+                with infile_engine.begin() as conn:
+                    conn.execute(load_stmt, {"path": Path(tmp_path).as_posix()})
+            finally:
+                infile_engine.dispose()
+        finally:
+            os.remove(tmp_path)
 
-    def execute_query(self, query):
-        """Execute SQL query and return results as DataFrame"""
+    def execute_query(self, query, chunksize=None, dtype_backend='pyarrow'):
+        """
+        Execute SQL query and return results as DataFrame
+
+        With chunksize set, rows are streamed from the server in chunks that
+        are concatenated at the end; peak memory is still about twice the
+        final frame. Use iter_query to aggregate without holding it all.
+        Columns are Arrow-backed by default (typed strings, nullable ints);
+        pass dtype_backend=None for classic NumPy dtypes.
+        """
         if self.engine is None:
             self.create_connection()
 
         try:
-            df = pd.read_sql(query, self.engine)
+            if chunksize is None:
+                df = pd.read_sql(query, self.engine, **_backend_kwargs(dtype_backend))
+            else:
+                chunks = list(self.iter_query(query, chunksize=chunksize,
+                                              dtype_backend=dtype_backend))
+                df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
             return df
         except Exception as e:
-            print(f"❌ Error executing query: {e}")
+            log.error("❌ Error executing query: %s", e)
             return pd.DataFrame()  # safer than returning None
 
+    def iter_query(self, query, chunksize=50_000, dtype_backend='pyarrow'):
+        """Yield query results as DataFrames of at most `chunksize` rows"""
+        if self.engine is None:
+            self.create_connection()
+        if self.engine is None:
+            log.error("❌ Error executing query: no database connection")
+            return
+
+        # stream_results uses a server-side cursor so rows are fetched per chunk
+        with self.engine.connect().execution_options(stream_results=True) as conn:
+            for chunk in pd.read_sql(query, conn, chunksize=chunksize,
+                                     **_backend_kwargs(dtype_backend)):
+                yield chunk
+
     def close_connection(self):
-        """Close database connection"""
-        if self.engine:
+        """
+        Close database connection (shared engines stay pooled)
+
+        Safe to call more than once; the engine is only disposed the first time.
+        """
+        if self.engine is None:
+            return
+        if not self.shared:
             self.engine.dispose()
-            print("✅ Database connection closed")
+            log.info("✅ Database connection closed")
+        self.engine = None
 
 
 # Example usage for testing connection
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     db = DatabaseConnection(
         host='localhost',
         user='root',
@@ -85,8 +245,9 @@ if __name__ == "__main__":
     if engine:
         print("\n🔍 Test query:")
         try:
-            df = pd.read_sql("SELECT NOW() as current_time;", engine)
-            print(df)
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT 1")).scalar() == 1
+            print("✅ SELECT 1 succeeded")
         except Exception as e:
             print(f"❌ Test query failed: {e}")
         finally:
@@ -1,14 +1,6 @@
-from src.database_connection import DatabaseConnection
+from sqlalchemy import text
 
-db = DatabaseConnection(
-    host='localhost',
-    user='root',
-    password='YOUR_PASSWORD',
-    database='customer_analytics'
-)
 
-engine = db.create_connection()
-if engine:
-    print("✅ MySQL connection successful!")
-else:
-    print("❌ Connection failed. Check your credentials.")
\ No newline at end of file
+def test_engine_alive(db_engine):
+    with db_engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
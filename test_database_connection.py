@@ -0,0 +1,131 @@
+import pytest
+
+# create_engine does not connect until first use, so no MySQL server is needed
+pd = pytest.importorskip("pandas")
+dbc = pytest.importorskip("src.database_connection")
+
+
+@pytest.fixture(autouse=True)
+def empty_engine_cache(monkeypatch):
+    monkeypatch.setattr(dbc, "_ENGINE_CACHE", {})
+
+
+def test_same_key_returns_same_engine():
+    first = dbc.DatabaseConnection(password="pw").create_connection()
+    second = dbc.DatabaseConnection(password="pw").create_connection()
+    assert first is second
+
+
+def test_changed_attributes_use_a_different_engine():
+    db = dbc.DatabaseConnection(password="pw")
+    first = db.create_connection()
+    db.host = "other-host"
+    assert db.create_connection() is not first
+
+
+def test_unshared_engine_is_not_cached():
+    db = dbc.DatabaseConnection(password="pw", shared=False)
+    db.create_connection()
+    assert dbc._ENGINE_CACHE == {}
+
+
+def test_close_twice_disposes_once():
+    db = dbc.DatabaseConnection(password="pw", shared=False)
+    engine = db.create_connection()
+    calls = []
+    engine.dispose = lambda: calls.append(1)
+
+    db.close_connection()
+    db.close_connection()
+
+    assert calls == [1]
+    assert db.engine is None
+
+
+def test_shared_close_keeps_cache_entry():
+    db = dbc.DatabaseConnection(password="pw")
+    engine = db.create_connection()
+    calls = []
+    engine.dispose = lambda: calls.append(1)
+
+    db.close_connection()
+
+    assert calls == []
+    assert db.engine is None
+    assert list(dbc._ENGINE_CACHE.values()) == [engine]
+
+
+def _infile_csv(df):
+    return dbc._prepare_for_infile(df).to_csv(index=False, header=False, na_rep='\\N',
+                                              lineterminator='\n')
+
+
+def test_prepare_for_infile_doubles_backslashes():
+    df = pd.DataFrame({'path': ['C:\\new', 'plain']})
+    assert _infile_csv(df) == 'C:\\\\new\nplain\n'
+    assert df['path'][0] == 'C:\\new'  # input frame is left untouched
+
+
+def test_prepare_for_infile_writes_na_marker():
+    df = pd.DataFrame({'s': ['a', None], 'x': [1.5, None]})
+    assert _infile_csv(df) == 'a,1.5\n\\N,\\N\n'
+
+
+def test_prepare_for_infile_bool_dtype():
+    df = pd.DataFrame({'b': [True, False]})
+    assert _infile_csv(df) == '1\n0\n'
+
+
+def test_prepare_for_infile_nullable_boolean_dtype():
+    df = pd.DataFrame({'b': pd.array([True, None, False], dtype='boolean')})
+    assert _infile_csv(df) == '1\n\\N\n0\n'
+
+
+def test_prepare_for_infile_object_bools():
+    df = pd.DataFrame({'b': [True, None, False]})
+    assert df['b'].dtype == object
+    assert _infile_csv(df) == '1\n\\N\n0\n'
+
+
+@pytest.fixture
+def sqlite_db():
+    """DatabaseConnection backed by an in-memory sqlite engine"""
+    from sqlalchemy import create_engine
+
+    db = dbc.DatabaseConnection(shared=False)
+    db.engine = create_engine("sqlite://")
+    pd.DataFrame({'n': range(5), 's': list('abcde')}).to_sql('t', db.engine, index=False)
+    return db
+
+
+def test_iter_query_yields_chunks(sqlite_db):
+    chunks = list(sqlite_db.iter_query("SELECT * FROM t", chunksize=2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+
+
+def test_execute_query_chunked_matches_unchunked(sqlite_db):
+    whole = sqlite_db.execute_query("SELECT * FROM t ORDER BY n")
+    chunked = sqlite_db.execute_query("SELECT * FROM t ORDER BY n", chunksize=2)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+def test_execute_query_chunked_empty_result(sqlite_db):
+    df = sqlite_db.execute_query("SELECT * FROM t WHERE n < 0", chunksize=2)
+    assert df.empty
+
+
+def test_execute_query_chunked_numpy_dtypes(sqlite_db):
+    df = sqlite_db.execute_query("SELECT n FROM t", chunksize=2, dtype_backend=None)
+    assert df['n'].dtype == 'int64'
+
+
+def test_execute_query_chunked_keeps_colons_in_literals(sqlite_db):
+    df = sqlite_db.execute_query("SELECT 'a:b' AS note", chunksize=2, dtype_backend=None)
+    assert df['note'].tolist() == ['a:b']
+
+
+def test_iter_query_without_connection(monkeypatch):
+    db = dbc.DatabaseConnection(password="pw")
+    monkeypatch.setattr(db, "create_connection", lambda: None)
+    assert list(db.iter_query("SELECT 1")) == []
+    assert db.execute_query("SELECT 1", chunksize=2).empty
@@ -0,0 +1,29 @@
+import setup_project_structure as sps
+
+
+def test_file_size_missing_and_empty(tmp_path):
+    path = tmp_path / "empty.csv"
+    assert sps.file_size(path) is None
+    path.touch()
+    assert sps.file_size(path) == 0
+
+
+def test_flatten_collects_all_parent_dirs(tmp_path):
+    entries, dirs = sps.flatten(tmp_path)
+
+    for path, _ in entries:
+        assert path.parent in dirs
+    assert tmp_path in dirs
+    assert tmp_path / "data" in dirs
+    assert tmp_path / "powerbi" / "screenshots" in dirs
+    assert all(d == tmp_path or tmp_path in d.parents for d in dirs)
+
+
+def test_main_writes_skeleton(tmp_path, monkeypatch):
+    root = tmp_path / sps.PROJECT_NAME
+    monkeypatch.setattr(sps, "ROOT", root)
+    sps.main()
+
+    assert (root / "src" / "__init__.py").read_bytes() == b"# src package\n"
+    assert (root / "data" / "raw" / "customer_shopping_behavior.csv").read_bytes() == sps.raw_csv_header
+    assert (root / "powerbi" / "screenshots").is_dir()